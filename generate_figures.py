@@ -13,6 +13,7 @@ Dependencies: matplotlib, numpy
 """
 
 import argparse
+import multiprocessing
 import os
 import matplotlib
 matplotlib.use('Agg')
@@ -23,44 +24,86 @@ import numpy as np
 CHART_TYPES = ['line', 'bar', 'scatter', 'heatmap', 'box']
 
 
+def _generate_heatmap_fast(fig_num, title, output_dir, rng):
+    """Render the placeholder heatmap directly through Pillow.
+
+    Colormapping the 6x6 grid in NumPy and writing the PNG with Pillow
+    skips matplotlib's full render pipeline (ticks, colorbar, AGG pass),
+    which dominates runtime for this chart type. Returns the output path,
+    or None when Pillow is unavailable so the caller can fall back to the
+    matplotlib branch.
+    """
+    try:
+        from PIL import Image, ImageDraw, ImageFont
+    except ImportError:
+        return None
+
+    # Title sized to the 2400px canvas, comparable to the 13pt/300dpi
+    # titles on the matplotlib chart types. load_default(size=...) needs
+    # Pillow >= 10.1; older versions fall back to matplotlib's bundled
+    # DejaVu Sans.
+    try:
+        font = ImageFont.load_default(size=48)
+    except TypeError:
+        from matplotlib import font_manager
+        font = ImageFont.truetype(font_manager.findfont('DejaVu Sans'), 48)
+
+    data = rng.random((6, 6))
+    rgba = (plt.get_cmap('YlOrRd')(data) * 255).astype(np.uint8)
+    # Nearest-neighbour resize keeps the crisp cell edges imshow would draw
+    img = Image.fromarray(rgba).resize((2400, 1800), Image.NEAREST)
+    ImageDraw.Draw(img).text((40, 30), f'Figure {fig_num}: {title}', fill='black', font=font)
+
+    path = os.path.join(output_dir, f'Figure_{fig_num}.png')
+    img.save(path, compress_level=3)
+    print(f"Generated: {path}")
+    return path
+
+
 def generate_figure(fig_num, title, output_dir):
     """Generate a single placeholder figure with varied chart type."""
     chart_type = CHART_TYPES[(fig_num - 1) % len(CHART_TYPES)]
-    np.random.seed(fig_num * 42)
+    # Per-figure PCG64 generator: faster than the legacy global RandomState
+    # and safe if figure generation is ever parallelized.
+    rng = np.random.default_rng(fig_num * 42)
+
+    if chart_type == 'heatmap':
+        path = _generate_heatmap_fast(fig_num, title, output_dir, rng)
+        if path:
+            return path
 
     fig, ax = plt.subplots(1, 1, figsize=(8, 6))
 
     if chart_type == 'line':
         x = np.linspace(0, 10, 50)
-        for j in range(3):
-            y = np.sin(x + fig_num + j) + np.random.normal(0, 0.15, 50)
-            ax.plot(x, y, linewidth=1.5, alpha=0.8, label=f'Group {j+1}')
-        ax.fill_between(x, y - 0.3, y + 0.3, alpha=0.1)
-        ax.legend()
+        ys = np.sin(x + fig_num + np.arange(3)[:, None]) + rng.normal(0, 0.15, (3, 50))
+        ax.plot(x, ys.T, linewidth=1.5, alpha=0.8)
+        ax.fill_between(x, ys[-1] - 0.3, ys[-1] + 0.3, alpha=0.1)
+        ax.legend([f'Group {j+1}' for j in range(3)])
         ax.set_xlabel('Time (hours)')
         ax.set_ylabel('Response')
 
     elif chart_type == 'bar':
         categories = ['Control', 'Treatment A', 'Treatment B', 'Treatment C']
-        values = np.random.uniform(20, 80, len(categories))
-        errors = np.random.uniform(3, 10, len(categories))
+        values = rng.uniform(20, 80, len(categories))
+        errors = rng.uniform(3, 10, len(categories))
         colors = ['#4C72B0', '#DD8452', '#55A868', '#C44E52']
         ax.bar(categories, values, yerr=errors, capsize=5, color=colors, alpha=0.8)
         ax.set_ylabel('Measurement (%)')
 
     elif chart_type == 'scatter':
-        x = np.random.normal(50, 15, 80)
-        y = 0.6 * x + np.random.normal(0, 8, 80)
+        x = rng.normal(50, 15, 80)
+        y = 0.6 * x + rng.normal(0, 8, 80)
         ax.scatter(x, y, alpha=0.6, edgecolors='k', linewidth=0.5)
         z = np.polyfit(x, y, 1)
         p = np.poly1d(z)
-        ax.plot(sorted(x), p(sorted(x)), 'r--', linewidth=1.5, label=f'R²=0.{np.random.randint(60,95)}')
+        ax.plot(sorted(x), p(sorted(x)), 'r--', linewidth=1.5, label=f'R²=0.{rng.integers(60, 95)}')
         ax.legend()
         ax.set_xlabel('Variable X')
         ax.set_ylabel('Variable Y')
 
     elif chart_type == 'heatmap':
-        data = np.random.rand(6, 6)
+        data = rng.random((6, 6))
         im = ax.imshow(data, cmap='YlOrRd', aspect='auto')
         ax.set_xticks(range(6))
         ax.set_yticks(range(6))
@@ -69,7 +112,7 @@ def generate_figure(fig_num, title, output_dir):
         fig.colorbar(im, ax=ax, label='Intensity')
 
     elif chart_type == 'box':
-        data = [np.random.normal(loc, 5, 30) for loc in [40, 55, 48, 62]]
+        data = rng.normal([40, 55, 48, 62], 5, (30, 4)).T.tolist()
         bp = ax.boxplot(data, labels=['Control', 'Low', 'Medium', 'High'], patch_artist=True)
         colors = ['#4C72B0', '#DD8452', '#55A868', '#C44E52']
         for patch, color in zip(bp['boxes'], colors):
@@ -81,7 +124,11 @@ def generate_figure(fig_num, title, output_dir):
     ax.grid(True, alpha=0.3)
 
     path = os.path.join(output_dir, f'Figure_{fig_num}.png')
-    fig.savefig(path, dpi=300, bbox_inches='tight')
+    # tight_layout computes margins once, where bbox_inches='tight' renders
+    # the whole figure twice (bbox probe + real output). compress_level=3
+    # is ~4x faster than the zlib default with little size impact on plots.
+    fig.tight_layout()
+    fig.savefig(path, dpi=300, pil_kwargs={'compress_level': 3})
     plt.close(fig)
     print(f"Generated: {path}")
     return path
@@ -99,8 +146,16 @@ def main():
     if len(titles) < args.count:
         titles.extend([f"Placeholder {i}" for i in range(len(titles) + 1, args.count + 1)])
 
-    for i in range(1, args.count + 1):
-        generate_figure(i, titles[i - 1], args.output_dir)
+    jobs = [(i, titles[i - 1], args.output_dir) for i in range(1, args.count + 1)]
+    if len(jobs) == 1:
+        generate_figure(*jobs[0])
+        return
+
+    # Figures are independent and rendering/PNG compression is CPU-bound,
+    # so fan out one process per figure up to the core count. Workers
+    # inherit the non-interactive Agg backend set at import time.
+    with multiprocessing.Pool(processes=min(len(jobs), os.cpu_count() or 1)) as pool:
+        pool.starmap(generate_figure, jobs)
 
 
 if __name__ == "__main__":
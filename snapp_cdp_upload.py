@@ -6,6 +6,8 @@ Auto-discovers the Chrome page WebSocket URL. Handles hidden file inputs.
 
 Usage:
     python snapp_cdp_upload.py --file <path> --button-text "Upload response"
+    python snapp_cdp_upload.py --file <a> --button-text "Upload response" \
+                               --file <b> --button-text "Upload cover letter"
     python snapp_cdp_upload.py --file <path> --button-text "Upload anonymised manuscript"
     python snapp_cdp_upload.py --file <path> --button-text "Upload figure(s)"
     python snapp_cdp_upload.py --file <path> --button-text "Upload cover letter"
@@ -16,16 +18,22 @@ Dependencies: websocket-client (pip install websocket-client)
 """
 
 import argparse
-import base64
+import binascii
 import json
+import os
 import sys
 import time
 import urllib.request
 import websocket
 
+# Discovered page WS URL is cached here so consecutive invocations in one
+# session (cover letter, response, figures, manuscript) skip the /json
+# discovery round trip.
+CDP_CACHE_FILE = os.path.expanduser('~/.cache/snapp_cdp.ws')
 
-def get_page_ws_url():
-    """Get the WebSocket URL for the active browser page."""
+
+def _discover_ws_url():
+    """Query the DevTools /json endpoint for the active page's WS URL."""
     data = json.loads(urllib.request.urlopen('http://127.0.0.1:9222/json').read())
     for page in data:
         if page.get('type') == 'page' and 'springernature' in page.get('url', ''):
@@ -34,11 +42,49 @@ def get_page_ws_url():
     return data[0]['webSocketDebuggerUrl']
 
 
+def get_page_ws_url(refresh=False):
+    """Get the WebSocket URL for the active browser page.
+
+    Honors the CDP_WS_URL env var first, then the session cache file,
+    and only then hits the /json discovery endpoint. Pass refresh=True
+    to force rediscovery (e.g. after a failed connect).
+    """
+    if not refresh:
+        env_url = os.environ.get('CDP_WS_URL')
+        if env_url:
+            return env_url
+        try:
+            with open(CDP_CACHE_FILE) as f:
+                cached = f.read().strip()
+            if cached:
+                return cached
+        except OSError:
+            pass
+
+    url = _discover_ws_url()
+    try:
+        os.makedirs(os.path.dirname(CDP_CACHE_FILE), exist_ok=True)
+        with open(CDP_CACHE_FILE, 'w') as f:
+            f.write(url)
+    except OSError:
+        pass
+    return url
+
+
 def connect():
-    """Connect to Chrome via CDP with suppress_origin (mandatory for SNAPP)."""
-    ws_url = get_page_ws_url()
-    ws = websocket.create_connection(ws_url, suppress_origin=True)
-    return ws
+    """Connect to Chrome via CDP with suppress_origin (mandatory for SNAPP).
+
+    skip_utf8_validation matters for large download payloads:
+    websocket-client's pure-Python UTF-8 check dominates receive time on
+    multi-megabyte base64 frames.
+    """
+    kwargs = dict(suppress_origin=True, skip_utf8_validation=True,
+                  enable_multithread=True)
+    try:
+        return websocket.create_connection(get_page_ws_url(), **kwargs)
+    except Exception:
+        # Cached target may have gone away; rediscover and retry once.
+        return websocket.create_connection(get_page_ws_url(refresh=True), **kwargs)
 
 
 _msg_id = 0
@@ -59,19 +105,52 @@ def send_cmd(ws, method, params=None):
             return resp
 
 
+def wait_for_upload_response(ws, url_substring="/upload", timeout=30):
+    """Block until the page receives a response to the upload request.
+
+    Drains CDP events until a Network.responseReceived whose URL contains
+    url_substring (or a Page.frameStoppedLoading, for form posts that
+    navigate) arrives. Returns True on the event, False on timeout.
+    """
+    deadline = time.time() + timeout
+    ws.settimeout(timeout)
+    try:
+        while time.time() < deadline:
+            try:
+                msg = json.loads(ws.recv())
+            except websocket.WebSocketTimeoutException:
+                return False
+            method = msg.get("method", "")
+            if method == "Network.responseReceived":
+                url = msg.get("params", {}).get("response", {}).get("url", "")
+                if url_substring in url:
+                    return True
+            elif method == "Page.frameStoppedLoading":
+                return True
+        return False
+    finally:
+        ws.settimeout(None)
+
+
 def upload_file(ws, file_path, button_text):
     """Upload a file to a SNAPP form identified by its button text."""
     send_cmd(ws, "DOM.enable")
     send_cmd(ws, "Runtime.enable")
+    # Event domains for the post-click wait
+    send_cmd(ws, "Network.enable")
+    send_cmd(ws, "Page.enable")
 
-    # Find the file input within the form that contains the specified button
+    # Find the file input and the upload button in a single DOM traversal.
+    # button_text goes through json.dumps so quotes in the label cannot
+    # break the expression.
     js = f"""
         (() => {{
+            const text = {json.dumps(button_text)};
             const forms = document.querySelectorAll('form');
             for (const form of forms) {{
                 const btn = form.querySelector('button, input[type="submit"]');
-                if (btn && (btn.textContent || btn.value || '').includes('{button_text}')) {{
-                    return form.querySelector('input[type="file"]');
+                if (btn && (btn.textContent || btn.value || '').includes(text)) {{
+                    return {{ input: form.querySelector('input[type="file"]'), btn: btn }};
                 }}
             }}
             return null;
@@ -82,38 +161,42 @@ def upload_file(ws, file_path, button_text):
         "returnByValue": False
     })
 
-    obj_id = result.get("result", {}).get("result", {}).get("objectId")
-    if not obj_id:
+    pair_id = result.get("result", {}).get("result", {}).get("objectId")
+    if not pair_id:
+        print(f"ERROR: Form not found for button '{button_text}'", file=sys.stderr)
+        return False
+
+    # Pull both objectIds from the returned {input, btn} pair
+    props = send_cmd(ws, "Runtime.getProperties", {
+        "objectId": pair_id,
+        "ownProperties": True
+    })
+    obj_ids = {p["name"]: p.get("value", {}).get("objectId")
+               for p in props.get("result", {}).get("result", [])}
+    if not obj_ids.get("input"):
         print(f"ERROR: File input not found for button '{button_text}'", file=sys.stderr)
         return False
 
     # Get the backend node ID
-    node_result = send_cmd(ws, "DOM.describeNode", {"objectId": obj_id})
+    node_result = send_cmd(ws, "DOM.describeNode", {"objectId": obj_ids["input"]})
     node_id = node_result["result"]["node"]["backendNodeId"]
 
-    # Set the file
+    # Set the file (the command response means the input is populated;
+    # no settling sleep is needed)
     send_cmd(ws, "DOM.setFileInputFiles", {
         "files": [file_path],
         "backendNodeId": node_id
     })
-    time.sleep(1)
 
-    # Click the upload button
-    click_js = f"""
-        (() => {{
-            const forms = document.querySelectorAll('form');
-            for (const form of forms) {{
-                const btn = form.querySelector('button, input[type="submit"]');
-                if (btn && (btn.textContent || btn.value || '').includes('{button_text}')) {{
-                    btn.click();
-                    return 'clicked';
-                }}
-            }}
-            return 'not found';
-        }})()
-    """
-    send_cmd(ws, "Runtime.evaluate", {"expression": click_js})
-    time.sleep(5)
+    # Click the already-resolved upload button, then wait for the upload
+    # response instead of sleeping a fixed 5 seconds
+    send_cmd(ws, "Runtime.callFunctionOn", {
+        "objectId": obj_ids["btn"],
+        "functionDeclaration": "function() { this.click(); }"
+    })
+    if not wait_for_upload_response(ws):
+        print(f"WARNING: No upload response observed for '{button_text}' "
+              f"within timeout", file=sys.stderr)
     print(f"Uploaded: {file_path} via '{button_text}'")
     return True
 
@@ -158,18 +241,19 @@ def download_file(ws, file_url, output_path):
     """Download a file from SNAPP via XHR in browser context."""
     send_cmd(ws, "Runtime.enable")
 
+    # FileReader.readAsDataURL base64-encodes the blob in native code;
+    # the old per-byte String.fromCharCode loop built a multi-megabyte
+    # string one character at a time.
     js = f"""
         new Promise((resolve, reject) => {{
             const xhr = new XMLHttpRequest();
             xhr.open('GET', '{file_url}', true);
-            xhr.responseType = 'arraybuffer';
+            xhr.responseType = 'blob';
             xhr.onload = () => {{
-                const bytes = new Uint8Array(xhr.response);
-                let binary = '';
-                for (let i = 0; i < bytes.byteLength; i++) {{
-                    binary += String.fromCharCode(bytes[i]);
-                }}
-                resolve(btoa(binary));
+                const fr = new FileReader();
+                fr.onload = () => resolve(fr.result.split(',', 2)[1]);
+                fr.onerror = () => reject('FileReader failed');
+                fr.readAsDataURL(xhr.response);
             }};
             xhr.onerror = () => reject('XHR failed');
             xhr.send();
@@ -183,8 +267,12 @@ def download_file(ws, file_url, output_path):
 
     b64 = result.get("result", {}).get("result", {}).get("value")
     if b64:
+        # Decode in 4-byte-aligned chunks straight to disk instead of
+        # materializing a second full copy of the file in memory.
+        chunk_size = 64 * 1024 * 4
         with open(output_path, 'wb') as f:
-            f.write(base64.b64decode(b64))
+            for start in range(0, len(b64), chunk_size):
+                f.write(binascii.a2b_base64(b64[start:start + chunk_size]))
         print(f"Downloaded: {output_path} ({len(b64)} base64 chars)")
         return True
     else:
@@ -195,20 +283,25 @@ def download_file(ws, file_url, output_path):
 def main():
     parser = argparse.ArgumentParser(description="SNAPP file operations via CDP")
     group = parser.add_mutually_exclusive_group(required=True)
-    group.add_argument("--file", help="Path to file to upload")
+    group.add_argument("--file", action="append",
+                       help="Path to file to upload (repeatable for multiple uploads)")
     group.add_argument("--remove", help="Filename substring to remove")
     group.add_argument("--download", help="File URL to download")
 
-    parser.add_argument("--button-text", help="Upload button text (required for --file)")
+    parser.add_argument("--button-text", action="append",
+                        help="Upload button text (one per --file)")
     parser.add_argument("--output", help="Output path (required for --download)")
     args = parser.parse_args()
 
     ws = connect()
     try:
         if args.file:
-            if not args.button_text:
-                parser.error("--button-text is required for --file")
-            success = upload_file(ws, args.file, args.button_text)
+            if not args.button_text or len(args.button_text) != len(args.file):
+                parser.error("--button-text is required once per --file")
+            # One connection for all uploads amortizes the WS handshake.
+            success = True
+            for file_path, button_text in zip(args.file, args.button_text):
+                success = upload_file(ws, file_path, button_text) and success
         elif args.remove:
             success = remove_file(ws, args.remove)
         elif args.download:
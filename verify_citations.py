@@ -13,41 +13,91 @@ Supported input formats: .docx, .txt, .md
 
 Output: JSON report with verification status for each reference, plus a summary.
 
-Dependencies: python-docx (optional, for .docx files)
+Dependencies: requests (optional, enables HTTP connection pooling),
+              rapidfuzz (optional, faster title similarity scoring),
+              refextract (optional, more accurate reference parsing)
 """
 
 import argparse
+import functools
+import hashlib
 import json
+import mmap
 import re
+import string
 import sys
+import threading
 import time
 import urllib.parse
 import urllib.request
 import os
+import xml.etree.ElementTree as ET
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from difflib import SequenceMatcher
 
+# RapidFuzz computes the same similarity in vectorized C, far faster than
+# difflib on the many short-string comparisons the matching loops perform.
+try:
+    from rapidfuzz import fuzz as _fuzz
+except ImportError:
+    _fuzz = None
+
+# refextract (CERN's trained reference parser) beats the period-splitting
+# heuristic on hard cases like 'et al.' and 'U. S. A.', which otherwise
+# produce garbage titles that waste API queries across all three services.
+try:
+    import refextract as _refextract
+except ImportError:
+    _refextract = None
+
 # Minimum title similarity ratio to accept a match (0.0 - 1.0)
 TITLE_SIMILARITY_THRESHOLD = 0.55
 
+# Patterns used in the reference-parsing hot loop, compiled once at import.
+_NORM_PUNCT = re.compile(r'[^\w\s]')
+_DOI_RE = re.compile(r'(10\.\d{4,}/[^\s,;]+)')
+_YEAR_RE = re.compile(r'[\(\[]?((?:19|20)\d{2})[a-z]?[\)\]]?')
+_REF_SPLIT = re.compile(r'\n\s*(?:\[?\d+[\].)]\s+)')
+_PARA_SPLIT = re.compile(r'\n\s*\n')
+_REF_HEADING = re.compile(
+    r'(?i)\n\s*(?:references|bibliography|works\s+cited|literature\s+cited)\s*\n')
+# Bytes twin of _REF_HEADING so plain-text files can be scanned via mmap
+# before any decoding happens.
+_REF_HEADING_BYTES = re.compile(
+    rb'(?i)\n\s*(?:references|bibliography|works\s+cited|literature\s+cited)\s*\n')
+
+# Worker threads for reference verification (workload is almost entirely
+# network-bound, so this mostly overlaps HTTP latency).
+MAX_WORKERS = 8
+
 # ---------------------------------------------------------------------------
 # Utility
 # ---------------------------------------------------------------------------
 
+# Single-pass translation table for normalize_title: ASCII punctuation
+# becomes a space (split() collapses the runs), typographic quote marks
+# and the ellipsis are dropped outright.
+_PUNCT_TABLE = str.maketrans({c: ' ' for c in string.punctuation})
+_PUNCT_TABLE.update(str.maketrans({c: None for c in '…“”‘’`´'}))
+
+
+@functools.lru_cache(maxsize=4096)
 def normalize_title(title):
     """Lowercase, strip punctuation, collapse whitespace for comparison."""
     if not title:
         return ""
-    t = title.lower()
-    t = re.sub(r'[^\w\s]', '', t)
-    t = re.sub(r'\s+', ' ', t).strip()
-    return t
+    return " ".join(title.lower().translate(_PUNCT_TABLE).split())
 
 
+@functools.lru_cache(maxsize=4096)
 def title_similarity(a, b):
     """Return similarity ratio between two titles (0.0 - 1.0)."""
     na, nb = normalize_title(a), normalize_title(b)
     if not na or not nb:
         return 0.0
+    if _fuzz is not None:
+        return _fuzz.ratio(na, nb) / 100.0
     return SequenceMatcher(None, na, nb).ratio()
 
 
@@ -55,38 +105,58 @@ def title_similarity(a, b):
 # Reference extraction
 # ---------------------------------------------------------------------------
 
+# WordprocessingML namespace for paragraph elements in word/document.xml.
+_DOCX_P_TAG = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}p'
+
+
 def extract_text_from_docx(filepath):
-    """Extract plain text from a DOCX file using python-docx."""
+    """Extract plain text from a DOCX file by streaming its document XML.
+
+    Reads word/document.xml straight out of the zip with iterparse and
+    frees each paragraph node once its text has been collected, so peak
+    memory stays proportional to one paragraph instead of the whole
+    python-docx object model plus two copies of the manuscript text.
+    """
+    def paragraphs(stream):
+        for _, elem in ET.iterparse(stream, events=('end',)):
+            if elem.tag == _DOCX_P_TAG:
+                yield ''.join(elem.itertext())
+                elem.clear()
+
     try:
-        from docx import Document
-        doc = Document(filepath)
-        return "\n".join(p.text for p in doc.paragraphs)
-    except ImportError:
-        sys.exit("Error: python-docx is required for .docx files. Install with: pip install python-docx")
+        with zipfile.ZipFile(filepath) as z, z.open('word/document.xml') as f:
+            return "\n".join(paragraphs(f))
+    except (zipfile.BadZipFile, KeyError, ET.ParseError) as e:
+        sys.exit(f"Error: Could not read DOCX file {filepath}: {e}")
 
 
 def extract_text(filepath):
-    """Return the full text of a manuscript file."""
+    """Return the text of a manuscript file, for plain files via mmap.
+
+    Plain .txt/.md files are memory-mapped and scanned for the References
+    heading at the byte level first, so only the heading and everything
+    after it go through the codec — the manuscript body (often the bulk
+    of a long document) is never decoded. When no heading is found the
+    whole file is decoded, preserving the full-text fallback parse.
+    """
     ext = os.path.splitext(filepath)[1].lower()
     if ext == ".docx":
         return extract_text_from_docx(filepath)
-    else:
-        with open(filepath, "r", encoding="utf-8", errors="ignore") as f:
-            return f.read()
+
+    with open(filepath, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return ""
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            m = _REF_HEADING_BYTES.search(mm)
+            start = m.start() if m else 0
+            return mm[start:].decode("utf-8", "ignore")
 
 
 def extract_references_section(text):
     """Isolate the References / Bibliography section from manuscript text."""
-    patterns = [
-        r'(?i)\n\s*references\s*\n',
-        r'(?i)\n\s*bibliography\s*\n',
-        r'(?i)\n\s*works\s+cited\s*\n',
-        r'(?i)\n\s*literature\s+cited\s*\n',
-    ]
-    for pat in patterns:
-        m = re.search(pat, text)
-        if m:
-            return text[m.end():]
+    m = _REF_HEADING.search(text)
+    if m:
+        return text[m.end():]
     return ""
 
 
@@ -99,13 +169,13 @@ def parse_references(ref_text):
     refs = []
 
     # Try numbered references first: "1." or "[1]" or "1)"
-    numbered = re.split(r'\n\s*(?:\[?\d+[\].)]\s+)', ref_text)
+    numbered = _REF_SPLIT.split(ref_text)
     numbered = [r.strip() for r in numbered if r.strip() and len(r.strip()) > 15]
     if len(numbered) >= 2:
         return numbered
 
     # Fall back to paragraph-based splitting
-    blocks = re.split(r'\n\s*\n', ref_text)
+    blocks = _PARA_SPLIT.split(ref_text)
     for b in blocks:
         b = b.strip()
         if len(b) > 15:
@@ -113,36 +183,70 @@ def parse_references(ref_text):
     return refs
 
 
+def _refextract_metadata(ref_string):
+    """Parse one reference with refextract. Returns a partial metadata dict
+    (only the fields the parser resolved), or None if parsing failed."""
+    try:
+        parsed = _refextract.extract_references_from_string(ref_string)
+    except Exception:
+        return None
+    if not parsed:
+        return None
+    ref = parsed[0]
+
+    def first(key):
+        val = ref.get(key)
+        if isinstance(val, list):
+            val = val[0] if val else None
+        return val or None
+
+    meta = {}
+    for our_key, their_key in [("title", "title"), ("authors", "author"),
+                               ("year", "year"), ("journal", "journal_title"),
+                               ("doi", "doi")]:
+        val = first(their_key)
+        if val:
+            meta[our_key] = str(val)
+    return meta or None
+
+
 def extract_citation_metadata(ref_string):
     """
     Attempt to extract structured metadata from a raw reference string.
     Returns a dict with keys: authors, title, year, journal, doi (any may be None).
+
+    Uses refextract when installed; the regex/period-splitting heuristics
+    below fill in whatever the parser could not resolve (and everything,
+    when it is not installed).
     """
     meta = {"raw": ref_string, "authors": None, "title": None, "year": None, "journal": None, "doi": None}
 
+    if _refextract is not None:
+        parsed = _refextract_metadata(ref_string)
+        if parsed:
+            meta.update(parsed)
+
     # DOI
-    doi_match = re.search(r'(10\.\d{4,}/[^\s,;]+)', ref_string)
-    if doi_match:
-        meta["doi"] = doi_match.group(1).rstrip(".")
+    if not meta["doi"]:
+        doi_match = _DOI_RE.search(ref_string)
+        if doi_match:
+            meta["doi"] = doi_match.group(1).rstrip(".")
 
     # Year
-    year_match = re.search(r'[\(\[]?((?:19|20)\d{2})[a-z]?[\)\]]?', ref_string)
-    if year_match:
-        meta["year"] = year_match.group(1)
+    if not meta["year"]:
+        year_match = _YEAR_RE.search(ref_string)
+        if year_match:
+            meta["year"] = year_match.group(1)
 
     # Title heuristic: text between first period and second period (common in Vancouver/APA)
     parts = ref_string.split(". ")
-    if len(parts) >= 3:
-        candidate = parts[1].strip()
-        if len(candidate) > 10:
-            meta["title"] = candidate.rstrip(".")
-    elif len(parts) == 2:
+    if not meta["title"] and len(parts) >= 2:
         candidate = parts[1].strip()
         if len(candidate) > 10:
             meta["title"] = candidate.rstrip(".")
 
     # Authors heuristic: text before the first period or year
-    if parts:
+    if not meta["authors"] and parts:
         meta["authors"] = parts[0].strip()
 
     return meta
@@ -152,13 +256,161 @@ def extract_citation_metadata(ref_string):
 # API helpers
 # ---------------------------------------------------------------------------
 
+class TokenBucket:
+    """Token-bucket rate limiter shared across the worker threads.
+
+    Tokens refill continuously at `rate` per second up to `burst`, so
+    requests only wait when the host's real rate limit would otherwise be
+    exceeded — unlike a fixed sleep, a slow response earns back budget for
+    the next call.
+    """
+
+    def __init__(self, rate, burst):
+        self.rate = float(rate)
+        self.capacity = float(burst)
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available, then consume it."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity,
+                                  self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1.0:
+                    self.tokens -= 1.0
+                    return
+                wait = (1.0 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+# A free NCBI API key raises the E-utilities limit from 3 to 10 req/s.
+NCBI_API_KEY = os.environ.get("NCBI_API_KEY", "")
+
+# Per-host request pacing (NCBI allows 3 req/s without an API key; S2's
+# anonymous tier is ~1 req/s; CrossRef is far more lenient).
+_HOST_BUCKETS = {
+    "eutils.ncbi.nlm.nih.gov": TokenBucket(10, 10) if NCBI_API_KEY else TokenBucket(3, 3),
+    "api.semanticscholar.org": TokenBucket(1, 1),
+    "api.crossref.org": TokenBucket(50, 50),
+}
+_DEFAULT_BUCKET = TokenBucket(5, 5)
+
+
+def set_ncbi_api_key(key):
+    """Register an NCBI API key and raise the PubMed pacing accordingly."""
+    global NCBI_API_KEY
+    NCBI_API_KEY = key or ""
+    if NCBI_API_KEY:
+        _HOST_BUCKETS["eutils.ncbi.nlm.nih.gov"] = TokenBucket(10, 10)
+
+
+def _with_api_key(url):
+    """Append the NCBI API key to an E-utilities/idconv URL if one is set."""
+    if NCBI_API_KEY:
+        return f"{url}&api_key={urllib.parse.quote(NCBI_API_KEY)}"
+    return url
+
+_USER_AGENT = "ManusAgent/1.0"
+
+# Prefer a pooled requests.Session when available: keep-alive connections
+# avoid a fresh TCP+TLS handshake for every one of the ~3N API calls.
+# Fall back to plain urllib (one connection per request) if requests is
+# not installed.
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    SESSION = requests.Session()
+    SESSION.headers["User-Agent"] = _USER_AGENT
+    _adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16,
+                           max_retries=Retry(total=2, backoff_factor=1.5,
+                                             status_forcelist=[429, 500, 502, 503]))
+    SESSION.mount("https://", _adapter)
+    SESSION.mount("http://", _adapter)
+except ImportError:
+    SESSION = None
+
+
+# Persistent response cache so repeat runs on the same manuscript (common
+# while drafting amendments) skip the network entirely. Keyed by URL hash;
+# entries expire after 30 days. Disable with --no-cache.
+CACHE_DIR = os.path.expanduser("~/.cache/verify_citations")
+CACHE_TTL = 30 * 24 * 3600
+USE_CACHE = True
+
+
+def _cache_path(url):
+    return os.path.join(CACHE_DIR, hashlib.sha1(url.encode("utf-8")).hexdigest() + ".json")
+
+
+def _cache_get(url):
+    """Return a cached JSON response for url, or None on miss/expiry."""
+    if not USE_CACHE:
+        return None
+    path = _cache_path(url)
+    try:
+        if time.time() - os.path.getmtime(path) <= CACHE_TTL:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def _cache_put(url, data):
+    """Store a JSON response on disk. Error responses are never cached."""
+    if not USE_CACHE or not isinstance(data, dict) or "error" in data:
+        return
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        path = _cache_path(url)
+        # Writers are threads in one process, so the pid alone would let
+        # concurrent workers share (and corrupt) a temp file.
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
 def _http_get_json(url, retries=2):
-    """Perform an HTTP GET and return parsed JSON, with retry logic."""
+    """Perform an HTTP GET and return parsed JSON. Retries on failure."""
+    cached = _cache_get(url)
+    if cached is not None:
+        return cached
+
+    host = urllib.parse.urlsplit(url).hostname or ""
+    bucket = _HOST_BUCKETS.get(host, _DEFAULT_BUCKET)
+
+    if SESSION is not None:
+        # Retries are handled by the urllib3 Retry mounted on the session.
+        try:
+            bucket.acquire()
+            resp = SESSION.get(url, timeout=15)
+            # A 429/5xx body can be valid JSON (S2 returns a plain message
+            # dict when rate-limited); raise so it is reported as an error
+            # and never cached as a real result.
+            resp.raise_for_status()
+            data = resp.json()
+            _cache_put(url, data)
+            return data
+        except Exception as e:
+            return {"error": str(e)}
+
     for attempt in range(retries + 1):
         try:
-            req = urllib.request.Request(url, headers={"User-Agent": "ManusAgent/1.0"})
+            bucket.acquire()
+            req = urllib.request.Request(url, headers={"User-Agent": _USER_AGENT})
             with urllib.request.urlopen(req, timeout=15) as resp:
-                return json.loads(resp.read().decode("utf-8"))
+                data = json.loads(resp.read().decode("utf-8"))
+            _cache_put(url, data)
+            return data
         except Exception as e:
             if attempt < retries:
                 time.sleep(1.5)
@@ -171,28 +423,49 @@ def _http_get_json(url, retries=2):
 # ---------------------------------------------------------------------------
 
 PUBMED_BASE = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils"
+IDCONV_BASE = "https://www.ncbi.nlm.nih.gov/pmc/utils/idconv/v1.0/"
+
+
+def batch_doi_to_pmid(dois):
+    """Convert many DOIs to PMIDs via the NCBI idconv service.
+
+    idconv accepts up to 200 comma-separated IDs per request, replacing
+    one esearch round trip per DOI with a single batched call. Returns a
+    dict mapping lowercase DOI -> PMID for the DOIs it could resolve.
+    """
+    mapping = {}
+    dois = [d for d in dict.fromkeys(dois) if d]
+    for start in range(0, len(dois), 200):
+        chunk = dois[start:start + 200]
+        url = f"{IDCONV_BASE}?ids={urllib.parse.quote(','.join(chunk))}&format=json"
+        data = _http_get_json(_with_api_key(url))
+        for rec in data.get("records", []):
+            doi, pmid = rec.get("doi"), rec.get("pmid")
+            if doi and pmid:
+                mapping[doi.lower()] = str(pmid)
+    return mapping
 
 
 def search_pubmed_by_doi(doi):
     """Search PubMed by DOI. Returns PMID or None."""
     url = f"{PUBMED_BASE}/esearch.fcgi?db=pubmed&term={urllib.parse.quote(doi)}[doi]&retmode=json"
-    data = _http_get_json(url)
+    data = _http_get_json(_with_api_key(url))
     ids = data.get("esearchresult", {}).get("idlist", [])
     return ids[0] if ids else None
 
 
 def search_pubmed_by_title(title):
     """Search PubMed by title. Returns (PMID, matched_title) or (None, None)."""
-    clean = re.sub(r'[^\w\s]', ' ', title)
+    clean = _NORM_PUNCT.sub(' ', title)
     url = f"{PUBMED_BASE}/esearch.fcgi?db=pubmed&term={urllib.parse.quote(clean)}[ti]&retmode=json"
-    data = _http_get_json(url)
+    data = _http_get_json(_with_api_key(url))
     ids = data.get("esearchresult", {}).get("idlist", [])
     if not ids:
         return None, None
     # Fetch the title of the first result to verify similarity
     pmid = ids[0]
     fetch_url = f"{PUBMED_BASE}/esummary.fcgi?db=pubmed&id={pmid}&retmode=json"
-    summary = _http_get_json(fetch_url)
+    summary = _http_get_json(_with_api_key(fetch_url))
     result_data = summary.get("result", {})
     entry = result_data.get(pmid, {})
     matched_title = entry.get("title", "")
@@ -219,6 +492,83 @@ def search_pubmed(meta):
     return result
 
 
+def _pubmed_esearch(meta):
+    """Resolve one reference to a candidate PMID via esearch (no esummary).
+
+    Returns (pmid, method) where method is 'doi' or 'title', or (None, None).
+    """
+    if meta.get("doi"):
+        pmid = search_pubmed_by_doi(meta["doi"])
+        if pmid:
+            return pmid, "doi"
+    if meta.get("title"):
+        clean = _NORM_PUNCT.sub(' ', meta["title"])
+        url = f"{PUBMED_BASE}/esearch.fcgi?db=pubmed&term={urllib.parse.quote(clean)}[ti]&retmode=json"
+        data = _http_get_json(_with_api_key(url))
+        ids = data.get("esearchresult", {}).get("idlist", [])
+        if ids:
+            return ids[0], "title"
+    return None, None
+
+
+def fetch_pubmed_summaries(pmids):
+    """Fetch esummary metadata for many PMIDs at once.
+
+    E-utilities accept up to 200 comma-separated IDs per esummary call,
+    so this needs ceil(N/200) requests instead of one per PMID.
+    Returns a dict mapping pmid -> esummary entry.
+    """
+    summaries = {}
+    pmids = [p for p in dict.fromkeys(pmids) if p]
+    for start in range(0, len(pmids), 200):
+        chunk = pmids[start:start + 200]
+        url = f"{PUBMED_BASE}/esummary.fcgi?db=pubmed&id={','.join(chunk)}&retmode=json"
+        data = _http_get_json(_with_api_key(url))
+        result_data = data.get("result", {})
+        for pmid in chunk:
+            if pmid in result_data:
+                summaries[pmid] = result_data[pmid]
+    return summaries
+
+
+def batch_search_pubmed(metas, executor):
+    """Verify many references against PubMed with batched esummary calls.
+
+    Phase A resolves all DOIs in one batched idconv call and runs the
+    remaining per-reference esearch lookups concurrently; phase B fetches
+    the titles needed for similarity checks in a single batched esummary
+    request. This cuts PubMed traffic from ~2N requests to N+1 or better.
+    Returns a list of result dicts aligned with metas.
+    """
+    doi_pmids = batch_doi_to_pmid([m.get("doi") for m in metas if m.get("doi")])
+
+    def _resolve(meta):
+        doi = meta.get("doi")
+        if doi:
+            pmid = doi_pmids.get(doi.lower())
+            if pmid:
+                return pmid, "doi"
+        return _pubmed_esearch(meta)
+
+    candidates = list(executor.map(_resolve, metas))
+
+    title_pmids = [pmid for pmid, method in candidates if pmid and method == "title"]
+    summaries = fetch_pubmed_summaries(title_pmids) if title_pmids else {}
+
+    results = []
+    for (pmid, method), meta in zip(candidates, metas):
+        result = {"found": False, "pmid": None, "method": None, "similarity": None}
+        if method == "doi":
+            result.update(found=True, pmid=pmid, method="doi")
+        elif method == "title":
+            matched_title = summaries.get(pmid, {}).get("title", "")
+            sim = title_similarity(meta["title"], matched_title)
+            if sim >= TITLE_SIMILARITY_THRESHOLD:
+                result.update(found=True, pmid=pmid, method="title", similarity=round(sim, 3))
+        results.append(result)
+    return results
+
+
 # ---------------------------------------------------------------------------
 # Semantic Scholar verification
 # ---------------------------------------------------------------------------
@@ -320,8 +670,53 @@ def search_crossref(meta):
 # Main verification pipeline
 # ---------------------------------------------------------------------------
 
-def verify_single_reference(idx, meta, delay=0.4):
-    """Verify one reference across all three sources."""
+def verify_doi_fast_path(idx, meta):
+    """Cheap verification path for references with an extracted DOI.
+
+    Looks the DOI up on CrossRef first (authoritative for DOIs), and only
+    if that confirms it, on Semantic Scholar. Two agreeing sources already
+    satisfy the 'verified' threshold, so PubMed and the expensive fuzzy
+    title searches are skipped entirely. Returns a finished entry, or None
+    when the DOI lookups do not agree and the full pipeline should run.
+    """
+    doi = meta.get("doi")
+    if not doi:
+        return None
+
+    cr = search_crossref_by_doi(doi)
+    if not cr.get("found") or (cr.get("doi") or "").lower() != doi.lower():
+        return None
+
+    paper = search_s2_by_doi(doi)
+    if not paper:
+        return None
+
+    return {
+        "index": idx,
+        "raw": meta["raw"],
+        "extracted_title": meta.get("title"),
+        "extracted_doi": doi,
+        "extracted_year": meta.get("year"),
+        "pubmed": {"found": False, "pmid": None, "method": None, "similarity": None,
+                   "skipped": True},
+        "semantic_scholar": {"found": True, "paper_id": paper.get("paperId"),
+                             "method": "doi", "matched_title": paper.get("title"),
+                             "similarity": None},
+        "crossref": {"found": True, "doi": cr["doi"], "method": "doi", "similarity": None},
+        "status": "verified",
+    }
+
+
+def verify_single_reference(idx, meta, api_pool=None, pubmed=None):
+    """
+    Verify one reference across all three sources.
+
+    If an executor is supplied via api_pool, the API lookups run
+    concurrently (each source is independent; per-host pacing is handled
+    inside _http_get_json). Otherwise they run serially. A precomputed
+    PubMed result (from batch_search_pubmed) can be passed via pubmed to
+    skip the per-reference PubMed lookup.
+    """
     entry = {
         "index": idx,
         "raw": meta["raw"],
@@ -334,17 +729,17 @@ def verify_single_reference(idx, meta, delay=0.4):
         "status": "unverified",
     }
 
-    # PubMed
-    time.sleep(delay)
-    entry["pubmed"] = search_pubmed(meta)
-
-    # Semantic Scholar
-    time.sleep(delay)
-    entry["semantic_scholar"] = search_s2(meta)
-
-    # CrossRef
-    time.sleep(delay)
-    entry["crossref"] = search_crossref(meta)
+    if api_pool is not None:
+        pm_future = None if pubmed is not None else api_pool.submit(search_pubmed, meta)
+        s2_future = api_pool.submit(search_s2, meta)
+        cr_future = api_pool.submit(search_crossref, meta)
+        entry["pubmed"] = pubmed if pubmed is not None else pm_future.result()
+        entry["semantic_scholar"] = s2_future.result()
+        entry["crossref"] = cr_future.result()
+    else:
+        entry["pubmed"] = pubmed if pubmed is not None else search_pubmed(meta)
+        entry["semantic_scholar"] = search_s2(meta)
+        entry["crossref"] = search_crossref(meta)
 
     # Determine overall status
     sources_found = sum([
@@ -388,12 +783,33 @@ def run_verification(filepath, output_path=None):
         return report
 
     print("[4/4] Verifying references against PubMed, Semantic Scholar, and CrossRef...")
-    results = []
+    metas = []
     for i, raw in enumerate(raw_refs, 1):
         meta = extract_citation_metadata(raw)
         print(f"  [{i}/{len(raw_refs)}] {(meta.get('title') or raw)[:70]}...")
-        entry = verify_single_reference(i, meta)
-        results.append(entry)
+        metas.append((i, meta))
+
+    # One job per reference; each job fans out to the APIs on a separate
+    # pool so inner lookups can never starve the outer jobs. DOI-bearing
+    # references try the cheap CrossRef+S2 short-circuit first; only the
+    # rest go through the batched PubMed pass and full verification.
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as ref_pool, \
+         ThreadPoolExecutor(max_workers=MAX_WORKERS) as api_pool:
+        fast_entries = list(ref_pool.map(lambda im: verify_doi_fast_path(im[0], im[1]), metas))
+
+        by_index = {e["index"]: e for e in fast_entries if e is not None}
+        remaining = [(i, meta) for (i, meta), e in zip(metas, fast_entries) if e is None]
+
+        if remaining:
+            pubmed_results = batch_search_pubmed([m for _, m in remaining], api_pool)
+            jobs = [(i, meta, pm) for (i, meta), pm in zip(remaining, pubmed_results)]
+            for entry in ref_pool.map(
+                    lambda job: verify_single_reference(job[0], job[1], api_pool=api_pool,
+                                                        pubmed=job[2]),
+                    jobs):
+                by_index[entry["index"]] = entry
+
+        results = [by_index[i] for i, _ in metas]
 
     # Summary
     verified = sum(1 for r in results if r["status"] == "verified")
@@ -456,8 +872,19 @@ def main():
     parser.add_argument("manuscript", help="Path to manuscript file (.docx, .txt, .md)")
     parser.add_argument("--output", "-o", default=None,
                         help="Output JSON report path (default: <manuscript>_citation_report.json)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Bypass the on-disk API response cache")
+    parser.add_argument("--api-key", default=None,
+                        help="NCBI API key (or set NCBI_API_KEY); raises the "
+                             "PubMed rate limit from 3 to 10 req/s")
     args = parser.parse_args()
 
+    if args.no_cache:
+        global USE_CACHE
+        USE_CACHE = False
+    if args.api_key:
+        set_ncbi_api_key(args.api_key)
+
     if not os.path.isfile(args.manuscript):
         sys.exit(f"Error: File not found: {args.manuscript}")
 